@@ -13,6 +13,12 @@ RAIO_EXPLOSAO = 30           # raio da explosão
 DRAG_COEFF = 0.05            # resistência do ar
 MAGNUS_COEFF = 5.0           # efeito Magnus
 HOMING_ACCEL = 30.0          # aceleração para mísseis guiados
+VENTO_CELULA = 100           # espaçamento (px) entre os nós da grade de vento
+VENTO_SUAVIZACAO = 1.5       # rapidez (1/s) com que cada nó segue seu alvo
+VENTO_RAJADA = 0.3           # desvio das rajadas locais (fração da intensidade)
+VENTO_RAJADA_DURACAO = 2.0   # tempo típico (s) de vida de uma rajada
+VENTO_CISALHAMENTO = 0.6     # ganho extra de vento no topo da tela (altitude)
+VENTO_VERTICAL = 0.2         # fração das rajadas que vira corrente vertical
 
 # Força máxima aumentada para 200
 FORCA_MIN = 10
@@ -40,9 +46,6 @@ AMARELO  = (255, 255, 0)
 CINZA    = (100, 100, 100)
 MARROM   = (139, 69, 19)
 
-# Variável global de vento (que pode mudar dinamicamente)
-wind_x = 0
-
 # Parâmetros de campanha
 level = 1
 level_start = True
@@ -146,6 +149,52 @@ def generate_obstacles(num):
         y = y_ground - h
         obstacles.append(Obstacle(x, y, w, h))
 
+# -------------------------------------------------
+# CAMPO DE VENTO (grade 2D com rajadas e cisalhamento)
+# -------------------------------------------------
+class WindField:
+    def __init__(self, intensidade, base=0.0):
+        self.intensidade = intensidade  # limite do vento predominante
+        self.base = base                # vento predominante ao nível do solo
+        self.cols = int(math.ceil(LARGURA_TELA / VENTO_CELULA)) + 1
+        self.linhas = int(math.ceil(ALTURA_TELA / VENTO_CELULA)) + 1
+        # Perfil de altitude: nós mais altos (y menor) recebem mais vento
+        alturas = np.arange(self.linhas) * VENTO_CELULA
+        self.perfil = 1 + VENTO_CISALHAMENTO * np.clip(1 - alturas / ALTURA_TELA, 0, 1)
+        # campo[0] = vento horizontal, campo[1] = vento vertical, por nó
+        self.rajadas = np.zeros((2, self.linhas, self.cols))
+        self.campo = np.zeros((2, self.linhas, self.cols))
+        self.campo[0] = self.base * self.perfil[:, None]
+    def atualizar(self, dt):
+        # Vento predominante oscila suavemente, limitado pelo nível
+        self.base += random.uniform(-0.5, 0.5) * dt
+        self.base = max(-self.intensidade, min(self.base, self.intensidade))
+        # Rajadas locais: ruído por nó que decai com o tempo (não acumula)
+        sigma = self.intensidade * VENTO_RAJADA * math.sqrt(2 * dt / VENTO_RAJADA_DURACAO)
+        self.rajadas *= 1 - min(1.0, dt / VENTO_RAJADA_DURACAO)
+        self.rajadas += np.random.standard_normal(self.rajadas.shape) * sigma
+        # Cada nó se aproxima gradualmente do seu alvo, sem saltos bruscos
+        alvo_x = self.base * self.perfil[:, None] + self.rajadas[0]
+        alvo_y = VENTO_VERTICAL * self.rajadas[1]
+        k = min(1.0, VENTO_SUAVIZACAO * dt)
+        self.campo[0] += (alvo_x - self.campo[0]) * k
+        self.campo[1] += (alvo_y - self.campo[1]) * k
+    def amostrar(self, xs, ys):
+        # Interpolação bilinear vetorizada; retorna array (2, n) com (vx, vy)
+        gx = np.clip(np.asarray(xs, dtype=float) / VENTO_CELULA, 0, self.cols - 1)
+        gy = np.clip(np.asarray(ys, dtype=float) / VENTO_CELULA, 0, self.linhas - 1)
+        i0 = np.minimum(gx.astype(int), self.cols - 2)
+        j0 = np.minimum(gy.astype(int), self.linhas - 2)
+        tx = gx - i0
+        ty = gy - j0
+        c = self.campo
+        topo = c[:, j0, i0] * (1 - tx) + c[:, j0, i0 + 1] * tx
+        baixo = c[:, j0 + 1, i0] * (1 - tx) + c[:, j0 + 1, i0 + 1] * tx
+        return topo * (1 - ty) + baixo * ty
+
+# Campo global de vento (substituído a cada novo nível)
+wind_field = WindField(level * 5)
+
 # -------------------------------------------------
 # FUNÇÃO BALÍSTICA (para cálculo de ângulo)
 # -------------------------------------------------
@@ -214,10 +263,11 @@ class Projetil:
         self.spin = random.uniform(-1, 1)
         self.weapon_type = weapon_type
         self.target = target  # usado para mísseis guiados
-    def atualizar(self, dt):
+    def atualizar(self, dt, vento=(0.0, 0.0)):
         if not self.ativo:
             return
-        self.vx += wind_x * dt
+        self.vx += vento[0] * dt
+        self.vy += vento[1] * dt
         self.vx *= (1 - DRAG_COEFF * dt)
         self.vy *= (1 - DRAG_COEFF * dt)
         v = math.hypot(self.vx, self.vy)
@@ -257,7 +307,9 @@ class Particle:
         self.vx = random.uniform(-5, 5)
         self.vy = random.uniform(-5, 5)
         self.tempo_vida = random.uniform(0.5, 1.0)
-    def atualizar(self, dt):
+    def atualizar(self, dt, vento=(0.0, 0.0)):
+        self.vx += vento[0] * dt
+        self.vy += vento[1] * dt
         self.x += self.vx * dt * 60
         self.y += self.vy * dt * 60
         self.tempo_vida -= dt
@@ -294,10 +346,10 @@ powerup_timer = 0
 # FUNÇÃO DE NOVO NÍVEL (CAMPANHA E CHALLENGE)
 # -------------------------------------------------
 def new_level(lvl):
-    global terrain, wind_x, obstacles
+    global terrain, wind_field, obstacles
     terrain = generate_terrain()
     # Vento aumenta com o nível e pode mudar durante o nível
-    wind_x = random.uniform(-lvl * 5, lvl * 5)
+    wind_field = WindField(lvl * 5, random.uniform(-lvl * 5, lvl * 5))
     generate_obstacles(min(3 + lvl, 8))
 
 # -------------------------------------------------
@@ -535,11 +587,28 @@ while True:
         if random.random() < 0.005:
             tank2.weapon_type = random.choice(["normal", "guided", "grenade"])
 
+    # -------------------------------------------------
+    # AMOSTRAGEM DO VENTO (uma única chamada para projétil e partículas)
+    # -------------------------------------------------
+    corpos = lista_particulas[:]
+    if projetil_atual:
+        corpos.append(projetil_atual)
+    if corpos:
+        vento = wind_field.amostrar([c.x for c in corpos], [c.y for c in corpos])
+
+    # -------------------------------------------------
+    # ATUALIZAÇÃO DAS PARTÍCULAS
+    # -------------------------------------------------
+    for i, p in enumerate(lista_particulas[:]):
+        p.atualizar(dt, vento[:, i])
+        if p.tempo_vida <= 0:
+            lista_particulas.remove(p)
+
     # -------------------------------------------------
     # ATUALIZAÇÃO DO PROJÉTIL
     # -------------------------------------------------
     if projetil_atual:
-        projetil_atual.atualizar(dt)
+        projetil_atual.atualizar(dt, vento[:, -1])
         # Verifica colisão com tanques
         for t in [tank1, tank2]:
             dist = math.hypot(projetil_atual.x - t.x, projetil_atual.y - t.y)
@@ -571,14 +640,6 @@ while True:
             projetil_atual = None
             turno = 2 if turno == 1 else 1
 
-    # -------------------------------------------------
-    # ATUALIZAÇÃO DAS PARTÍCULAS
-    # -------------------------------------------------
-    for p in lista_particulas[:]:
-        p.atualizar(dt)
-        if p.tempo_vida <= 0:
-            lista_particulas.remove(p)
-
     # -------------------------------------------------
     # SPWAN DE POWER-UPS (inclui novos tipos: armor e speed)
     # -------------------------------------------------
@@ -644,9 +705,8 @@ while True:
     # -------------------------------------------------
     # ATUALIZAÇÃO DINÂMICA DO VENTO (opcional)
     # -------------------------------------------------
-    # Aqui o vento pode oscilar suavemente
-    wind_x += random.uniform(-0.5, 0.5) * dt
-    wind_x = max(-level*5, min(wind_x, level*5))
+    # Aqui o campo de vento evolui suavemente (rajadas e cisalhamento)
+    wind_field.atualizar(dt)
     
     # -------------------------------------------------
     # RENDERIZAÇÃO
@@ -665,7 +725,7 @@ while True:
         p.desenhar(tela)
     # HUD aprimorado
     fonte_hud = pygame.font.SysFont(None, 24)
-    hud_text = fonte_hud.render(f"Level: {level}  Wind: {wind_x:.1f}  Mode: {GAME_MODE.upper()}", True, PRETO)
+    hud_text = fonte_hud.render(f"Level: {level}  Wind: {wind_field.base:.1f}  Mode: {GAME_MODE.upper()}", True, PRETO)
     tela.blit(hud_text, (10, 10))
     turno_text = fonte_hud.render("Turno: " + ("Jogador" if turno == 1 else ("Inimigo (IA)" if GAME_MODE != "multiplayer" else "Jogador 2")), True, PRETO)
     tela.blit(turno_text, (10, 30))